@@ -1,8 +1,128 @@
+import array
+import functools
 import json
 import math
+import re
 from http import HTTPStatus
 from typing import Any, Callable, Awaitable
 
+import numpy as np
+import orjson
+
+_JSON_HEADERS = [(b"content-type", b"application/json")]
+_TEXT_HEADERS = [(b"content-type", b"text/plain")]
+
+# Для малых n вычисление дешевле, чем поиск в кэше
+_FACTORIAL_CACHE_THRESHOLD = 50
+# Наибольшее n, при котором n! укладывается в 4300 цифр - предел
+# преобразования int в строку по умолчанию, иначе его нельзя сериализовать
+_FACTORIAL_MAX_N = 1558
+
+# Для коротких массивов создание numpy-массива дороже самого суммирования
+_MEAN_NUMPY_THRESHOLD = 64
+
+# Как и при разборе в dict, учитывается последнее вхождение n
+_FACTORIAL_N_RE = re.compile(rb"(?:^|&)n=([^&]*)")
+_FACTORIAL_N_VALUE_RE = re.compile(rb"-?[0-9]+")
+
+_FIBONACCI_PREFIX = "/fibonacci/"
+_FIBONACCI_N_RE = re.compile(r"-?[0-9]+")
+# Аналогичный предел для /fibonacci
+_FIBONACCI_MAX_N = 20576
+
+# Тела ответов с ошибками не меняются, поэтому сериализуются один раз
+_ERR_QUERY_N_INVALID = orjson.dumps(
+    {"detail": "Parameter 'n' is required and must be a valid integer."}
+)
+_ERR_PATH_N_INVALID = orjson.dumps(
+    {"detail": "Path parameter 'n' must be a valid integer."}
+)
+_ERR_N_NEGATIVE = orjson.dumps(
+    {"detail": "Invalid value for 'n', must be non-negative."}
+)
+_ERR_N_TOO_LARGE = orjson.dumps(
+    {"detail": "Invalid value for 'n', result is too large."}
+)
+_ERR_BODY_INVALID = orjson.dumps(
+    {"detail": "Request body must be a non-empty array of floats."}
+)
+_ERR_BODY_EMPTY = orjson.dumps(
+    {"detail": "Invalid value for body, must be a non-empty array of floats."}
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _factorial(n: int) -> int:
+    """
+    Вычисляет факториал с кэшированием результатов для повторяющихся n.
+
+    Args:
+        n: Неотрицательное целое число.
+    """
+    return math.factorial(n)
+
+
+@functools.lru_cache(maxsize=1024)
+def _fibonacci(n: int) -> tuple[int, int]:
+    """
+    Вычисляет пару (F(n), F(n + 1)) методом быстрого удвоения за O(log n).
+
+    Биты n обходятся от старшего к младшему с использованием тождеств
+    F(2k) = F(k) * (2F(k + 1) - F(k)) и F(2k + 1) = F(k)^2 + F(k + 1)^2.
+
+    Args:
+        n: Неотрицательное целое число.
+    """
+    a, b = 0, 1
+    for i in range(n.bit_length() - 1, -1, -1):
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if (n >> i) & 1:
+            a, b = d, c + d
+        else:
+            a, b = c, d
+
+    return a, b
+
+
+def _dump_int_result(result: int) -> bytes:
+    """
+    Сериализует целочисленный результат в JSON.
+
+    orjson не поддерживает целые числа длиннее 64 бит, поэтому для них
+    сразу используется json с теми же разделителями, что и у orjson.
+
+    Args:
+        result: Результат вычисления.
+    """
+    if result.bit_length() < 64:
+        return orjson.dumps({"result": result})
+
+    return json.dumps({"result": result}, separators=(",", ":")).encode("utf-8")
+
+
+async def _send_json(
+    send: Callable[[dict[str, Any]], Awaitable[None]],
+    status: int,
+    body: bytes,
+) -> None:
+    """
+    Отправляет JSON ответ с заранее сериализованным телом.
+
+    Args:
+        send: Функция для отправки сообщений.
+        status: HTTP статус ответа.
+        body: Тело ответа в виде готового JSON.
+    """
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": _JSON_HEADERS,
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
 
 async def app(
     scope: dict[str, Any],
@@ -31,107 +151,84 @@ async def app(
     method = scope["method"]
     path = scope["path"]
 
-    async def json_response(status: int, content: dict) -> None:
-        """
-        Отправляет JSON ответ.
-
-        Args:
-            status: HTTP статус ответа.
-            content: Содержимое ответа в формате словаря.
-        """
-        await send(
-            {
-                "type": "http.response.start",
-                "status": status,
-                "headers": [(b"content-type", b"application/json")],
-            }
-        )
-        await send(
-            {"type": "http.response.body", "body": json.dumps(content).encode("utf-8")}
-        )
-
     if path == "/factorial" and method == "GET":
-        query_string = scope.get("query_string", b"").decode("utf-8")
-        params = dict(
-            param.split("=") for param in query_string.split("&") if "=" in param
-        )
-        n = params.get("n")
+        match = None
+        for match in _FACTORIAL_N_RE.finditer(scope.get("query_string", b"")):
+            pass
 
-        if n is None or not n.lstrip("-").isdigit():
-            await json_response(
-                HTTPStatus.UNPROCESSABLE_ENTITY,
-                {"detail": "Parameter 'n' is required and must be a valid integer."},
+        if match is None or _FACTORIAL_N_VALUE_RE.fullmatch(match.group(1)) is None:
+            await _send_json(
+                send, HTTPStatus.UNPROCESSABLE_ENTITY, _ERR_QUERY_N_INVALID
             )
             return
 
-        n = int(n)
+        n = int(match.group(1))
 
         if n < 0:
-            await json_response(
-                HTTPStatus.BAD_REQUEST,
-                {"detail": "Invalid value for 'n', must be non-negative."},
-            )
+            await _send_json(send, HTTPStatus.BAD_REQUEST, _ERR_N_NEGATIVE)
             return
 
-        result = math.factorial(n)
-        await json_response(HTTPStatus.OK, {"result": result})
+        if n > _FACTORIAL_MAX_N:
+            await _send_json(send, HTTPStatus.BAD_REQUEST, _ERR_N_TOO_LARGE)
+            return
 
-    elif path.startswith("/fibonacci/") and method == "GET":
-        try:
-            n = int(path.split("/")[2])
-        except (IndexError, ValueError):
-            await json_response(
-                HTTPStatus.UNPROCESSABLE_ENTITY,
-                {"detail": "Path parameter 'n' must be a valid integer."},
-            )
+        result = _factorial(n) if n >= _FACTORIAL_CACHE_THRESHOLD else math.factorial(n)
+        await _send_json(send, HTTPStatus.OK, _dump_int_result(result))
+
+    elif path.startswith(_FIBONACCI_PREFIX) and method == "GET":
+        n_str = path[len(_FIBONACCI_PREFIX) :]
+
+        if _FIBONACCI_N_RE.fullmatch(n_str) is None:
+            await _send_json(send, HTTPStatus.UNPROCESSABLE_ENTITY, _ERR_PATH_N_INVALID)
             return
 
+        n = int(n_str)
+
         if n < 0:
-            await json_response(
-                HTTPStatus.BAD_REQUEST,
-                {"detail": "Invalid value for 'n', must be non-negative."},
-            )
+            await _send_json(send, HTTPStatus.BAD_REQUEST, _ERR_N_NEGATIVE)
             return
 
-        a, b = 0, 1
-        for _ in range(n):
-            a, b = b, a + b
+        if n > _FIBONACCI_MAX_N:
+            await _send_json(send, HTTPStatus.BAD_REQUEST, _ERR_N_TOO_LARGE)
+            return
 
-        await json_response(HTTPStatus.OK, {"result": b})
+        _, result = _fibonacci(n)
+        await _send_json(send, HTTPStatus.OK, _dump_int_result(result))
 
     elif path == "/mean" and method == "GET":
-        request = await receive()
+        raw_body = bytearray()
+        while True:
+            request = await receive()
+            raw_body.extend(request.get("body", b""))
+            if not request.get("more_body", False):
+                break
+
         try:
-            body = json.loads(request.get("body", b"").decode("utf-8"))
-            if not isinstance(body, list) or not all(
-                isinstance(i, (float, int)) for i in body
-            ):
-                raise ValueError
-        except ValueError:
-            await json_response(
-                HTTPStatus.UNPROCESSABLE_ENTITY,
-                {"detail": "Request body must be a non-empty array of floats."},
-            )
+            body = orjson.loads(raw_body)
+            if not isinstance(body, list):
+                raise TypeError
+            # Конструктор array проверяет и приводит элементы к float за один проход
+            numbers = array.array("d", body)
+        except (ValueError, TypeError, OverflowError):
+            await _send_json(send, HTTPStatus.UNPROCESSABLE_ENTITY, _ERR_BODY_INVALID)
             return
 
-        if not body:
-            await json_response(
-                HTTPStatus.BAD_REQUEST,
-                {
-                    "detail": "Invalid value for body, must be a non-empty array of floats."
-                },
-            )
+        if not numbers:
+            await _send_json(send, HTTPStatus.BAD_REQUEST, _ERR_BODY_EMPTY)
             return
 
-        result = sum(body) / len(body)
-        await json_response(HTTPStatus.OK, {"result": result})
+        if len(numbers) < _MEAN_NUMPY_THRESHOLD:
+            result = sum(numbers) / len(numbers)
+        else:
+            result = float(np.frombuffer(numbers, dtype=np.float64).mean())
+        await _send_json(send, HTTPStatus.OK, orjson.dumps({"result": result}))
 
     else:
         await send(
             {
                 "type": "http.response.start",
                 "status": HTTPStatus.NOT_FOUND,
-                "headers": [(b"content-type", b"text/plain")],
+                "headers": _TEXT_HEADERS,
             }
         )
         await send({"type": "http.response.body", "body": b"404 Not Found"})
@@ -1,3 +1,4 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI(title="Shop API")
+app = FastAPI(title="Shop API", default_response_class=ORJSONResponse)
@@ -27,15 +27,16 @@ def add(info: PokemonInfo) -> PokemonEntity:
 
 
 def delete(id: int) -> None:
-    if id in _data:
-        del _data[id]
+    _data.pop(id, None)
 
 
 def get_one(id: int) -> PokemonEntity | None:
-    if id not in _data:
+    info = _data.get(id)
+
+    if info is None:
         return None
 
-    return PokemonEntity(id=id, info=_data[id])
+    return PokemonEntity(id=id, info=info)
 
 
 def get_many(offset: int = 0, limit: int = 10) -> Iterable[PokemonEntity]:
@@ -63,13 +64,15 @@ def upsert(id: int, info: PokemonInfo) -> PokemonEntity:
 
 
 def patch(id: int, patch_info: PatchPokemonInfo) -> PokemonEntity | None:
-    if id not in _data:
+    info = _data.get(id)
+
+    if info is None:
         return None
 
     if patch_info.name is not None:
-        _data[id].name = patch_info.name
+        info.name = patch_info.name
 
     if patch_info.published is not None:
-        _data[id].published = patch_info.published
+        info.published = patch_info.published
 
-    return PokemonEntity(id=id, info=_data[id])
+    return PokemonEntity(id=id, info=info)
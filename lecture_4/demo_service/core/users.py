@@ -29,7 +29,7 @@ class UserService:
     password_validators: list[Callable[[str], bool]] = field(default_factory=list)
 
     _data: dict[int, UserEntity] = field(init=False, default_factory=dict)
-    _username_index: dict[str, int] = field(init=False, default_factory=dict)
+    _username_index: dict[str, UserEntity] = field(init=False, default_factory=dict)
     _last_id: int = field(init=False, default=0)
 
     def register(self, user_info: UserInfo) -> UserEntity:
@@ -45,15 +45,12 @@ class UserService:
         entity = UserEntity(uid=self._last_id, info=user_info)
 
         self._data[entity.uid] = entity
-        self._username_index[entity.info.username] = entity.uid
+        self._username_index[entity.info.username] = entity
 
         return entity
 
     def get_by_username(self, username: str) -> UserEntity | None:
-        if username not in self._username_index:
-            return None
-
-        return self._data[self._username_index[username]]
+        return self._username_index.get(username)
 
     def get_by_id(self, uid: int) -> UserEntity | None:
         return self._data.get(uid)
@@ -1,6 +1,7 @@
 from http import HTTPStatus
 from typing import Any
 
+import orjson
 import pytest
 from async_asgi_testclient import TestClient
 
@@ -40,6 +41,8 @@ async def test_not_found(method: str, path: str):
         ({"n": 0}, HTTPStatus.OK),
         ({"n": 1}, HTTPStatus.OK),
         ({"n": 10}, HTTPStatus.OK),
+        ({"n": 1558}, HTTPStatus.OK),
+        ({"n": 1559}, HTTPStatus.BAD_REQUEST),
     ],
 )
 async def test_factorial(query: dict[str, Any], status_code: int):
@@ -51,16 +54,45 @@ async def test_factorial(query: dict[str, Any], status_code: int):
         assert "result" in response.json()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("query", "status_code", "result"),
+    [
+        ("n=5", HTTPStatus.OK, 120),
+        ("x=1&n=4", HTTPStatus.OK, 24),
+        ("n=3&n=4", HTTPStatus.OK, 24),
+        ("n=abc&n=4", HTTPStatus.OK, 24),
+        ("n=5&n=abc", HTTPStatus.UNPROCESSABLE_ENTITY, None),
+        ("n=5&n=", HTTPStatus.UNPROCESSABLE_ENTITY, None),
+        ("n=+5", HTTPStatus.UNPROCESSABLE_ENTITY, None),
+        ("n=5\n", HTTPStatus.UNPROCESSABLE_ENTITY, None),
+        ("n=1=2", HTTPStatus.UNPROCESSABLE_ENTITY, None),
+    ],
+)
+async def test_factorial_raw_query(query: str, status_code: int, result: int | None):
+    async with TestClient(app) as client:
+        response = await client.get(f"/factorial?{query}")
+
+    assert response.status_code == status_code
+    if status_code == HTTPStatus.OK:
+        assert response.json() == {"result": result}
+
+
 # @pytest.mark.xfail()
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("params", "status_code"),
     [
         ("/lol", HTTPStatus.UNPROCESSABLE_ENTITY),
+        ("/", HTTPStatus.UNPROCESSABLE_ENTITY),
+        ("/5/x", HTTPStatus.UNPROCESSABLE_ENTITY),
+        ("/+5", HTTPStatus.UNPROCESSABLE_ENTITY),
         ("/-1", HTTPStatus.BAD_REQUEST),
         ("/0", HTTPStatus.OK),
         ("/1", HTTPStatus.OK),
         ("/10", HTTPStatus.OK),
+        ("/20576", HTTPStatus.OK),
+        ("/20577", HTTPStatus.BAD_REQUEST),
     ],
 )
 async def test_fibonacci(params: str, status_code: int):
@@ -72,12 +104,46 @@ async def test_fibonacci(params: str, status_code: int):
         assert "result" in response.json()
 
 
+def _fibonacci_reference(n: int) -> int:
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+
+    return b
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("n", "expected"),
+    [
+        (0, 1),
+        (1, 1),
+        (2, 2),
+        (5, 8),
+        (10, 89),
+        (99, 354224848179261915075),
+        (20576, _fibonacci_reference(20576)),
+    ],
+)
+async def test_fibonacci_value(n: int, expected: int):
+    async with TestClient(app) as client:
+        response = await client.get(f"/fibonacci/{n}")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"result": expected}
+
+
 # @pytest.mark.xfail()
 @pytest.mark.asyncio()
 @pytest.mark.parametrize(
     ("json", "status_code"),
     [
         (None, HTTPStatus.UNPROCESSABLE_ENTITY),
+        ({}, HTTPStatus.UNPROCESSABLE_ENTITY),
+        ([1, "a"], HTTPStatus.UNPROCESSABLE_ENTITY),
+        ([[1]], HTTPStatus.UNPROCESSABLE_ENTITY),
+        ([None], HTTPStatus.UNPROCESSABLE_ENTITY),
+        ([True, 2], HTTPStatus.OK),
         ([], HTTPStatus.BAD_REQUEST),
         ([1, 2, 3], HTTPStatus.OK),
         ([1, 2.0, 3.0], HTTPStatus.OK),
@@ -91,3 +157,41 @@ async def test_mean(json: dict[str, Any] | None, status_code: int):
     assert response.status_code == status_code
     if status_code == HTTPStatus.OK:
         assert "result" in response.json()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("json", "result"),
+    [
+        ([1, 2, 3], 2.0),
+        (list(range(63)), 31.0),
+        (list(range(64)), 31.5),
+        (list(range(100)), 49.5),
+    ],
+)
+async def test_mean_value(json: list[float], result: float):
+    async with TestClient(app) as client:
+        response = await client.get("/mean", json=json)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"result": result}
+
+
+@pytest.mark.asyncio()
+async def test_mean_chunked_body():
+    messages = [
+        {"type": "http.request", "body": b"[1, 2,", "more_body": True},
+        {"type": "http.request", "body": b" 3, 6]", "more_body": False},
+    ]
+    sent = []
+
+    async def receive() -> dict[str, Any]:
+        return messages.pop(0)
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    await app({"type": "http", "method": "GET", "path": "/mean"}, receive, send)
+
+    assert sent[0]["status"] == HTTPStatus.OK
+    assert orjson.loads(sent[1]["body"]) == {"result": 3.0}